@@ -9,12 +9,21 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import pandas as pd
+import httpx
+import lxml.html as LH
+from lxml import etree
+import asyncio
+import copy
+import csv
+import itertools
 import time
+import queue
+import threading
 import logging
 from datetime import datetime
 import os
 import re
+import json
 
 # Setup logging
 logging.basicConfig(
@@ -26,63 +35,245 @@ logging.basicConfig(
     ]
 )
 
+# Resume state lives next to the output CSV (<output>.index.json and
+# <output>.done): the scraped constituency index, reused for a day for the
+# same state URL, and the numbers already written to that CSV
+INDEX_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Persistent Chrome profiles (one per fallback worker) so the HTTP cache,
+# DNS and TLS state survive between runs
+PROFILE_DIR = '2020/.chrome-profile'
+
+# Columns of the flattened output CSV, one row per candidate
+CSV_FIELDS = [
+    'Constituency_Number', 'Constituency_Name', 'Total_Electors', 'Total_Votes_Polled',
+    'Position', 'Candidate_Name', 'Votes', 'Vote_Percentage', 'Party',
+]
+
+ELECTORS_RE = re.compile(r'Electors:\s*([0-9,]+)')
+VOTES_RE = re.compile(r'Total Votes Polled:\s*([0-9,]+)\s*\(([0-9.]+)%\)')
+
+# XPath expressions for the lxml path, compiled once
+LINK_ROWS_XPATH = etree.XPath('(//*[@id="DataTables_Table_0"]//tr)[position()>1]')
+RESULT_ROWS_XPATH = etree.XPath('//*[@id="resultTable"]/tbody/tr')
+SUMMARY_ITEMS_XPATH = etree.XPath('//li')
+
+# Resources the scraper never reads; blocked in the fallback browser
+BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.woff*', '*.css', '*.mp4',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*',
+]
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def dom_parsed(driver):
+    """
+    Wait condition: the whole HTML has been parsed. With page_load_strategy
+    'none' an element can exist while the rest of the page is still arriving.
+    """
+    return driver.execute_script('return document.readyState') != 'loading'
+
+
+class RateLimiter:
+    """Async rate limiter: lets at most `rate` requests start per `period` seconds"""
+
+    def __init__(self, rate, period=1.0):
+        self.interval = period / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
 class BiharConstituencyScraper:
-    def __init__(self, output_file="2020/bihar_2020_constituencies.csv"):
+    def __init__(self, output_file="2020/bihar_2020_constituencies.csv", concurrency=8, requests_per_second=5,
+                 browser_workers=4):
         self.output_file = output_file
+        stem = os.path.splitext(output_file)[0]
+        self.index_cache_file = f'{stem}.index.json'
+        self.done_file = f'{stem}.done'
         self.all_data = []
+        self.concurrency = concurrency
+        self.browser_workers = browser_workers
+
+        # Keeps the crawl polite without serializing it
+        self.limiter = RateLimiter(requests_per_second)
 
         os.makedirs('2020', exist_ok=True)
 
+        # The pages are static HTML, so plain HTTP is enough; Selenium is only
+        # started if a page comes back without the expected table.
+        self.client = httpx.AsyncClient(http2=True, headers={'User-Agent': USER_AGENT}, timeout=20, follow_redirects=True)
+        # Pool of fallback drivers; each is used by one thread at a time
+        self._drivers = []
+        self._drivers_started = 0
+        self._worker_ids = itertools.count()
+        self._idle_drivers = queue.Queue()
+        self._drivers_lock = threading.Lock()
+
         # Setup Chrome options
         self.chrome_options = webdriver.ChromeOptions()
         self.chrome_options.add_argument('--headless')
         self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
+        # /dev/shm is tmpfs and faster than the disk fallback; only avoid it when it is missing
+        if not os.path.isdir('/dev/shm'):
+            self.chrome_options.add_argument('--disable-dev-shm-usage')
+        self.chrome_options.add_argument('--disk-cache-size=104857600')
         self.chrome_options.add_argument('--disable-gpu')
-        self.chrome_options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        self.chrome_options.add_argument(f'--user-agent={USER_AGENT}')
         self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         self.chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         self.chrome_options.add_experimental_option('useAutomationExtension', False)
+        # driver.get() returns immediately; the explicit waits on the tables
+        # are the only synchronization point
+        self.chrome_options.page_load_strategy = 'none'
+        self.chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+    def create_driver(self, worker_id=0):
+        # Chrome locks a profile directory, so each pooled driver gets its own
+        profile = os.path.abspath(os.path.join(PROFILE_DIR, f'worker-{worker_id}'))
+        os.makedirs(profile, exist_ok=True)
+
+        options = copy.deepcopy(self.chrome_options)
+        options.add_argument(f'--user-data-dir={profile}')
+        options.add_argument('--profile-directory=Default')
 
-    def create_driver(self):
         service = Service('/usr/bin/chromedriver')
-        driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        driver = webdriver.Chrome(service=service, options=options)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+        return driver
+
+    def acquire_driver(self):
+        """Take an idle fallback driver, starting a new one while the pool has room"""
+        try:
+            return self._idle_drivers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._drivers_lock:
+            start_new = self._drivers_started < self.browser_workers
+            if start_new:
+                worker_id = next(self._worker_ids)
+                self._drivers_started += 1
+
+        if not start_new:
+            return self._idle_drivers.get()
+
+        logging.info("Starting Selenium fallback driver")
+        try:
+            driver = self.create_driver(worker_id)
+        except Exception:
+            with self._drivers_lock:
+                self._drivers_started -= 1
+            raise
+        with self._drivers_lock:
+            self._drivers.append(driver)
         return driver
 
-    def get_constituency_links(self, driver, state_url):
+    def quit_drivers(self):
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers.clear()
+
+    async def _run_selenium(self, func, *args):
+        """Run a blocking Selenium fallback in a worker thread with a pooled driver"""
+        def call():
+            driver = self.acquire_driver()
+            try:
+                return func(driver, *args)
+            finally:
+                self._idle_drivers.put(driver)
+        return await asyncio.to_thread(call)
+
+    async def fetch(self, url):
+        """GET a page through the shared client, respecting the rate limit"""
+        async with self.limiter:
+            r = await self.client.get(url)
+        r.raise_for_status()
+        return r
+
+    async def get_constituency_links(self, state_url):
         """Extract all constituency links from DataTables_Table_0"""
+        cache = self.index_cache_file
+        if os.path.exists(cache) and time.time() - os.path.getmtime(cache) < INDEX_CACHE_MAX_AGE:
+            with open(cache, encoding='utf-8') as f:
+                cached = json.load(f)
+            # The index is only valid for the state page it was scraped from
+            if isinstance(cached, dict) and cached.get('url') == state_url:
+                constituencies = cached['constituencies']
+                logging.info(f"Loaded {len(constituencies)} constituencies from {cache}")
+                return constituencies
+
+        constituencies = await self._fetch_constituency_links(state_url)
+
+        if constituencies:
+            with open(cache, 'w', encoding='utf-8') as f:
+                json.dump({'url': state_url, 'constituencies': constituencies}, f)
+
+        return constituencies
+
+    async def _fetch_constituency_links(self, state_url):
         logging.info(f"Loading state page: {state_url}")
 
+        r = await self.fetch(state_url)
+        doc = LH.fromstring(r.text)
+        doc.make_links_absolute(str(r.url))
+
+        if not LINK_ROWS_XPATH(doc):
+            logging.warning("DataTables_Table_0 not in static HTML, falling back to Selenium")
+            return await self._run_selenium(self._get_constituency_links_selenium, state_url)
+
+        return self._parse_constituency_links(doc)
+
+    def _get_constituency_links_selenium(self, driver, state_url):
+        """Selenium fallback for get_constituency_links"""
         driver.get(state_url)
-        time.sleep(6)
 
-        # Wait for the table to load
+        # Wait until at least one data row has rendered
         wait = WebDriverWait(driver, 20)
-        table = wait.until(EC.presence_of_element_located((By.ID, "DataTables_Table_0")))
+        wait.until(EC.all_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#DataTables_Table_0 tbody tr")),
+            dom_parsed,
+        ))
+
+        # Parse the rendered page in-process rather than reading it element by element
+        doc = LH.fromstring(driver.page_source)
+        doc.make_links_absolute(driver.current_url)
+        return self._parse_constituency_links(doc)
+
+    def _parse_constituency_links(self, doc):
+        """Read constituency number, name and URL from each DataTables_Table_0 row"""
+        # Skip header row(s), process data rows
+        rows = LINK_ROWS_XPATH(doc)
 
         logging.info("Found DataTables_Table_0")
-
-        # Get all rows
-        rows = table.find_elements(By.TAG_NAME, "tr")
-        logging.info(f"Total rows in table: {len(rows)}")
+        logging.info(f"Total rows in table: {len(rows) + 1}")
 
         constituencies = []
 
-        # Skip header row(s), process data rows
-        for i, row in enumerate(rows[1:], start=1):
+        for i, row in enumerate(rows, start=1):
             try:
-                cells = row.find_elements(By.TAG_NAME, "td")
-
-                if len(cells) >= 2:
+                cells = row.findall('td')
+                link = cells[1].find('a') if len(cells) >= 2 else None
+                if link is not None:
                     # First column: constituency number
-                    const_num = cells[0].text.strip()
+                    const_num = cells[0].text_content().strip()
 
                     # Second column: constituency name with link
-                    second_cell = cells[1]
-                    link = second_cell.find_element(By.TAG_NAME, "a")
-                    const_name = link.text.strip()
-                    const_url = link.get_attribute("href")
+                    const_name = link.text_content().strip()
+                    const_url = link.get('href')
 
                     constituencies.append({
                         'number': const_num,
@@ -99,97 +290,101 @@ class BiharConstituencyScraper:
         logging.info(f"Total constituencies found: {len(constituencies)}")
         return constituencies
 
-    def scrape_constituency_details(self, driver, const_num, const_name, const_url):
+    def _parse_summary_item(self, const_data, text):
+        """Pick electors / votes polled out of one summary list item"""
+        if 'Electors:' in text and 'Male' not in text and 'Female' not in text:
+            # Extract number after "Electors:"
+            match = ELECTORS_RE.search(text)
+            if match:
+                const_data['Total_Electors'] = match.group(1).replace(',', '')
+
+        elif 'Total Votes Polled:' in text:
+            # Extract number and percentage
+            match = VOTES_RE.search(text)
+            if match:
+                const_data['Total_Votes_Polled'] = match.group(1).replace(',', '')
+                const_data['Voter_Turnout_Percent'] = match.group(2)
+
+    def _parse_candidate(self, cells):
+        """Build a candidate record from one row of resultTable cell texts"""
+        if len(cells) < 7:
+            return None
+
+        # Structure: #, # (hidden), Position, Name, Votes, Votes %, Party
+        return {
+            'Position': cells[2],
+            'Candidate_Name': cells[3],
+            'Votes': cells[4].replace(',', ''),
+            'Vote_Percentage': cells[5].replace('%', ''),
+            'Party': cells[6]
+        }
+
+    def _parse_constituency_details(self, doc, const_num, const_name, const_url):
+        """Build the constituency record from a parsed results page"""
+        const_data = {
+            'Constituency_Number': const_num,
+            'Constituency_Name': const_name,
+            'URL': const_url,
+            'Total_Electors': None,
+            'Total_Votes_Polled': None,
+            'Candidates': []
+        }
+
+        # Extract electors and votes polled from the page
+        for item in SUMMARY_ITEMS_XPATH(doc):
+            self._parse_summary_item(const_data, item.text_content().strip())
+
+        rows = RESULT_ROWS_XPATH(doc)
+        logging.info(f"Found {len(rows)} candidate rows")
+
+        for row in rows:
+            candidate = self._parse_candidate([td.text_content().strip() for td in row.findall('td')])
+            if candidate:
+                const_data['Candidates'].append(candidate)
+
+        logging.info(f"Extracted {len(const_data['Candidates'])} candidates")
+        return const_data
+
+    async def scrape_constituency_details(self, const_num, const_name, const_url):
         """Scrape detailed data for a single constituency"""
         logging.info(f"Scraping: {const_num} - {const_name}")
 
         try:
-            driver.get(const_url)
-            time.sleep(5)
-
-            wait = WebDriverWait(driver, 20)
-
-            # Initialize data storage
-            const_data = {
-                'Constituency_Number': const_num,
-                'Constituency_Name': const_name,
-                'URL': const_url,
-                'Total_Electors': None,
-                'Total_Votes_Polled': None,
-                'Candidates': []
-            }
-
-            # Extract electors and votes polled from the page
-            try:
-                # Find list items containing the data
-                list_items = driver.find_elements(By.TAG_NAME, "li")
-
-                for item in list_items:
-                    text = item.text.strip()
-
-                    if 'Electors:' in text and 'Male' not in text and 'Female' not in text:
-                        # Extract number after "Electors:"
-                        match = re.search(r'Electors:\s*([0-9,]+)', text)
-                        if match:
-                            const_data['Total_Electors'] = match.group(1).replace(',', '')
-
-                    elif 'Total Votes Polled:' in text:
-                        # Extract number and percentage
-                        match = re.search(r'Total Votes Polled:\s*([0-9,]+)\s*\(([0-9.]+)%\)', text)
-                        if match:
-                            const_data['Total_Votes_Polled'] = match.group(1).replace(',', '')
-                            const_data['Voter_Turnout_Percent'] = match.group(2)
-
-            except Exception as e:
-                logging.warning(f"Could not extract summary data: {e}")
+            r = await self.fetch(const_url)
+            doc = LH.fromstring(r.text)
 
-            # Find the results table (id="resultTable")
-            try:
-                # Wait for the results table to be present
-                results_table = wait.until(
-                    EC.presence_of_element_located((By.ID, "resultTable"))
+            if not RESULT_ROWS_XPATH(doc):
+                logging.warning(f"resultTable not in static HTML for {const_name}, falling back to Selenium")
+                return await self._run_selenium(
+                    self._scrape_constituency_details_selenium, const_num, const_name, const_url
                 )
 
-                # Find the tbody with candidates
-                tbody = results_table.find_element(By.TAG_NAME, "tbody")
-                rows = tbody.find_elements(By.TAG_NAME, "tr")
-
-                logging.info(f"Found {len(rows)} candidate rows")
-
-                for row in rows:
-                    try:
-                        cells = row.find_elements(By.TAG_NAME, "td")
-
-                        if len(cells) >= 6:
-                            # Extract candidate data
-                            # Structure: #, Position, Name, Votes, Votes %, Party
-                            candidate = {
-                                'Position': cells[2].text.strip(),  # Position
-                                'Candidate_Name': cells[3].text.strip(),  # Name
-                                'Votes': cells[4].text.strip().replace(',', ''),  # Votes
-                                'Vote_Percentage': cells[5].text.strip().replace('%', ''),  # Votes %
-                                'Party': cells[6].text.strip()  # Party (extract link text)
-                            }
-
-                            # Try to get party name from link if available
-                            try:
-                                party_link = cells[6].find_element(By.TAG_NAME, "a")
-                                candidate['Party'] = party_link.text.strip()
-                            except:
-                                pass
+            return self._parse_constituency_details(doc, const_num, const_name, const_url)
 
-                            const_data['Candidates'].append(candidate)
-
-                    except Exception as e:
-                        logging.warning(f"Error extracting candidate row: {e}")
-                        continue
+        except Exception as e:
+            logging.error(f"Error scraping {const_name}: {e}")
+            import traceback
+            logging.error(traceback.format_exc())
+            return None
 
-                logging.info(f"Extracted {len(const_data['Candidates'])} candidates")
+    def _scrape_constituency_details_selenium(self, driver, const_num, const_name, const_url):
+        """Selenium fallback for scrape_constituency_details"""
+        try:
+            driver.get(const_url)
 
-            except Exception as e:
+            # Wait for the results table to be present
+            try:
+                # The table tag alone isn't enough: its rows and the summary may not be parsed yet
+                WebDriverWait(driver, 20).until(EC.all_of(
+                    EC.presence_of_element_located((By.ID, "resultTable")),
+                    dom_parsed,
+                ))
+            except TimeoutException as e:
                 logging.warning(f"Could not find results table: {e}")
 
-            return const_data
+            # Parse the rendered page in-process rather than reading it element by element
+            doc = LH.fromstring(driver.page_source)
+            return self._parse_constituency_details(doc, const_num, const_name, const_url)
 
         except Exception as e:
             logging.error(f"Error scraping {const_name}: {e}")
@@ -198,38 +393,75 @@ class BiharConstituencyScraper:
             return None
 
     def flatten_data_for_csv(self, constituencies_data):
-        """Convert nested data to flat CSV format"""
-        rows = []
-
+        """Yield one flat CSV row per candidate"""
         for const in constituencies_data:
             if not const or not const.get('Candidates'):
                 continue
 
-            for candidate in const['Candidates']:
-                row = {
-                    'Constituency_Number': const['Constituency_Number'],
-                    'Constituency_Name': const['Constituency_Name'],
-                    'Total_Electors': const.get('Total_Electors', ''),
-                    'Total_Votes_Polled': const.get('Total_Votes_Polled', ''),
-                }
-
-                # Add all candidate fields
-                row.update(candidate)
-
-                rows.append(row)
-
-        return rows
+            base = {
+                'Constituency_Number': const['Constituency_Number'],
+                'Constituency_Name': const['Constituency_Name'],
+                'Total_Electors': const.get('Total_Electors', ''),
+                'Total_Votes_Polled': const.get('Total_Votes_Polled', ''),
+            }
 
-    def run(self, state_url, limit=None, start_from=1):
+            for candidate in const['Candidates']:
+                yield {**base, **candidate}
+
+    def load_done_constituencies(self):
+        """Constituency numbers already written to the output CSV by an earlier run"""
+        if not os.path.exists(self.output_file) or not os.path.exists(self.done_file):
+            return set()
+
+        # A line without its newline was cut off mid-write; it doesn't count,
+        # and is removed so the next number isn't appended onto it
+        with open(self.done_file, encoding='utf-8') as f:
+            lines = f.readlines()
+        if lines and not lines[-1].endswith('\n'):
+            lines.pop()
+            with open(self.done_file, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+        done = {line.strip() for line in lines if line.strip()}
+
+        if done:
+            self._drop_unfinished_rows(done)
+        return done
+
+    def _drop_unfinished_rows(self, done):
+        """
+        Remove rows of constituencies that never made it into the done file
+        (a run stopped between writing the rows and recording them), so they
+        aren't duplicated when those constituencies are scraped again
+        """
+        with open(self.output_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        # Party is the last column; None means the row itself was cut off
+        keep = [r for r in rows if r['Constituency_Number'] in done and r['Party'] is not None]
+        if len(keep) == len(rows):
+            return
+
+        logging.warning(f"Dropping {len(rows) - len(keep)} rows of unfinished constituencies from {self.output_file}")
+        tmp = self.output_file + '.tmp'
+        with open(tmp, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(keep)
+        os.replace(tmp, self.output_file)
+
+    async def run(self, state_url, limit=None, start_from=1):
         """Main scraping workflow"""
-        driver = self.create_driver()
-
         try:
             # Step 1: Get all constituency links
-            constituencies = self.get_constituency_links(driver, state_url)
+            constituencies = await self.get_constituency_links(state_url)
 
-            # Filter by start_from
-            constituencies = [c for c in constituencies if int(c['number']) >= start_from]
+            # Skip constituencies finished by an earlier run, then filter by start_from
+            done = self.load_done_constituencies()
+            if done:
+                logging.info(f"Resuming: {len(done)} constituencies already in {self.output_file}")
+            constituencies = [
+                c for c in constituencies
+                if str(c['number']) not in done and int(c['number']) >= start_from
+            ]
 
             # Apply limit if specified
             if limit:
@@ -238,49 +470,60 @@ class BiharConstituencyScraper:
 
             logging.info(f"Will scrape {len(constituencies)} constituencies")
 
-            # Step 2: Scrape each constituency
-            all_const_data = []
-
-            for idx, const in enumerate(constituencies, 1):
-                logging.info(f"Progress: {idx}/{len(constituencies)}")
-
-                const_data = self.scrape_constituency_details(
-                    driver,
-                    const['number'],
-                    const['name'],
-                    const['url']
+            # Step 2: Scrape constituencies concurrently, bounded by the semaphore,
+            # writing each one to the CSV as soon as it arrives
+            sem = asyncio.Semaphore(self.concurrency)
+            saved = 0
+
+            # Append when resuming; otherwise start both files afresh
+            mode = 'a' if done else 'w'
+            with open(self.output_file, mode, newline='', encoding='utf-8') as f, \
+                    open(self.done_file, mode, encoding='utf-8') as done_f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                if not done:
+                    writer.writeheader()
+
+                async def worker(idx, const):
+                    nonlocal saved
+                    async with sem:
+                        logging.info(f"Progress: {idx}/{len(constituencies)}")
+                        const_data = await self.scrape_constituency_details(
+                            const['number'],
+                            const['name'],
+                            const['url']
+                        )
+
+                    if const_data and const_data['Candidates']:
+                        writer.writerows(self.flatten_data_for_csv([const_data]))
+                        f.flush()
+                        done_f.write(f"{const_data['Constituency_Number']}\n")
+                        done_f.flush()
+                        saved += len(const_data['Candidates'])
+
+                await asyncio.gather(
+                    *(worker(idx, const) for idx, const in enumerate(constituencies, 1))
                 )
 
-                if const_data:
-                    all_const_data.append(const_data)
+            # Step 3: Report
+            if saved:
+                logging.info(f"Saved {saved} candidate records to {self.output_file}")
 
-                # Respectful delay
-                time.sleep(3)
+                print(f"\n{'='*80}")
+                print(f"SUCCESS! Saved {saved} candidate records")
+                print(f"Output file: {self.output_file}")
+                print(f"{'='*80}\n")
 
-            # Step 3: Flatten and save to CSV
-            if all_const_data:
-                flat_data = self.flatten_data_for_csv(all_const_data)
-
-                if flat_data:
-                    df = pd.DataFrame(flat_data)
-                    df.to_csv(self.output_file, index=False)
-                    logging.info(f"Saved {len(flat_data)} candidate records to {self.output_file}")
-
-                    print(f"\n{'='*80}")
-                    print(f"SUCCESS! Saved {len(flat_data)} candidate records")
-                    print(f"Output file: {self.output_file}")
-                    print(f"{'='*80}\n")
-
-                    # Show sample
-                    print("Sample data:")
-                    print(df.head(10).to_string())
-                else:
-                    logging.warning("No data to save after flattening")
+                # Show sample
+                print("Sample data:")
+                with open(self.output_file, newline='', encoding='utf-8') as f:
+                    for r in itertools.islice(csv.DictReader(f), 10):
+                        print(r)
             else:
                 logging.warning("No constituency data collected")
 
         finally:
-            driver.quit()
+            await self.client.aclose()
+            self.quit_drivers()
 
 
 if __name__ == "__main__":
@@ -309,7 +552,7 @@ if __name__ == "__main__":
     scraper = BiharConstituencyScraper(output_file=args.output)
 
     start_time = datetime.now()
-    scraper.run(args.url, limit=args.limit, start_from=args.start_from)
+    asyncio.run(scraper.run(args.url, limit=args.limit, start_from=args.start_from))
 
     duration = datetime.now() - start_time
     print(f"\nTotal time: {duration}")
@@ -8,26 +8,236 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+import aiohttp
+import lxml.html as LH
+from lxml import etree
 import pandas as pd
+import asyncio
+import csv
 import time
+import threading
 import logging
+import logging.handlers
+import queue
+import atexit
 from datetime import datetime
 import os
 import argparse
+from contextlib import contextmanager
+from collections import deque
+
+# uvloop is optional; when installed it replaces the default event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Logging: records are handed to a background listener through a queue so
+# fetch tasks and the Selenium thread never block on I/O, and the log file is
+# written in batches of 200 (or straight away on an error). Set up by the
+# first ECIScraper, so importing this module opens no log file.
+_log_listener = None
+
+
+def setup_logging():
+    """Start the log listener and route the root logger through it, once per process"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.handlers.MemoryHandler(
+            capacity=200,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler('eci_scraper.log'),
+        ),
+        logging.StreamHandler(),
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+class TokenBucket:
+    """Token bucket shared by all fetch tasks, allowing `rate` requests per second on average"""
+
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        # No token is handed out before this time (see pause)
+        self.resume_at = self.last
+
+    async def acquire(self):
+        """Wait until a token is available, then take it"""
+        while True:
+            now = time.monotonic()
+            if now < self.resume_at:
+                await asyncio.sleep(self.resume_at - now)
+                continue
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds):
+        """
+        Hold back every caller for `seconds`, e.g. when the server asks us to
+        slow down; overlapping pauses extend to the latest deadline rather
+        than adding up
+        """
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+
+# Columns of the combined results CSV
+MASTER_FIELDS = [
+    'Constituency_Number', 'Constituency_Name', 'Serial_No', 'Candidate', 'Party',
+    'EVM_Votes', 'Postal_Votes', 'Total_Votes', 'Percentage',
+]
+
+# Retries after a failed request, waiting RETRY_BACKOFF * 2**attempt seconds
+FETCH_RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+# Responses that mean the server wants fewer requests; all fetches pause for
+# the Retry-After time, or THROTTLE_BACKOFF * 2**attempt seconds without one
+THROTTLE_STATUSES = {429, 503}
+THROTTLE_BACKOFF = 2
+MAX_THROTTLE_WAIT = 60
+
+# The writer thread holds finished constituencies until it has this many,
+# then saves them together (the rest are saved when the run ends). Pages are
+# cached on disk, so a crash only costs re-parsing the unsaved ones
+WRITE_BATCH_SIZE = 25
+
+# Raw result pages are kept on disk for an hour so re-runs after a crash
+# don't refetch them
+CACHE_DIR = "cache"
+CACHE_MAX_AGE = 60 * 60
+
+# The Selenium fallback waits up to PAGE_WAIT_TIMEOUT seconds for the
+# results table to have a candidate row; a row needs at least three cells, so
+# a single-cell "loading" or "no data" placeholder doesn't end the wait early
+PAGE_WAIT_TIMEOUT = 15
+TABLE_ROWS_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr > td:nth-child(3)"))
+
+# Stops any subresources still loading and returns the rendered page, which
+# is then parsed with lxml like an HTTP response
+PAGE_HTML_JS = "window.stop(); return document.documentElement.outerHTML;"
+
+# XPath expressions for the lxml path, compiled once
+HEADING_XPATH = etree.XPath("//h2[contains(., 'Assembly Constituency')]")
+RESULTS_TABLE_XPATH = etree.XPath("//table[contains(@class, 'table-striped')]")
+ANY_TABLE_XPATH = etree.XPath("//table")
+TABLE_ROWS_XPATH = etree.XPath(".//tr")
+
+# Subresources the fallback browser never fetches; scripts are still allowed
+# since they may be what renders the table
+BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.woff*', '*.ttf', '*.css', '*.mp4',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*',
+]
+
+# Defaults shared by ECIScraper and the command line
+DEFAULT_WORKERS = 8
+DEFAULT_RPS = 4.0
+DEFAULT_BROWSERS = 4
+
+BASE_URL = "https://results.eci.gov.in/ResultAcGenNov2025"
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def build_chrome_options():
+    """Chrome options for the Selenium fallback, also used by get_driver() by default"""
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')  # Run in background
+    # driver.get returns at DOMContentLoaded; callers wait for what they need
+    options.page_load_strategy = 'eager'
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    # Add user agent to appear more like a real browser
+    options.add_argument(f'--user-agent={USER_AGENT}')
+    # Only the table DOM is read, so skip images, stylesheets and fonts
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-sync')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--mute-audio')
+    # Headless tabs count as backgrounded; keep timers and rendering at full speed
+    options.add_argument('--disable-background-timer-throttling')
+    options.add_argument('--disable-backgrounding-occluded-windows')
+    options.add_argument('--disable-renderer-backgrounding')
+    options.add_argument('--disable-ipc-flooding-protection')
+    options.add_argument('--disable-features=TranslateUI,BlinkGenPropertyTrees,IsolateOrigins,site-per-process')
+    return options
+
+
+def new_driver(options=None, block_resources=True):
+    """
+    Start Chrome, with the fallback options unless others are given
+
+    block_resources aborts requests matching BLOCKED_URLS; turn it off to see
+    a page as Chrome would normally load it.
+    """
+    service = Service('/usr/bin/chromedriver')
+    driver = webdriver.Chrome(service=service, options=options or build_chrome_options())
+    if block_resources:
+        # Abort matching requests at the network layer, before any bytes are fetched
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+    return driver
+
+
+# Long-lived driver for interactive debugging (test_page_load.py); scraper
+# runs use their own pool, which is quit at the end of every run
+_driver = None
+
+
+def get_driver(options=None, block_resources=True):
+    """
+    Return the module-wide driver, starting it on first use or after it was quit
+
+    The arguments only apply when a new driver is started (see new_driver);
+    quit_driver() first to switch them.
+    """
+    global _driver
+    if _driver is None or _driver.session_id is None:
+        _driver = new_driver(options, block_resources)
+    return _driver
+
+
+def quit_driver():
+    """Quit the module-wide driver if it is running"""
+    global _driver
+    if _driver is not None:
+        _driver.quit()
+        _driver = None
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('eci_scraper.log'),
-        logging.StreamHandler()
-    ]
-)
 
 class ECIScraper:
-    def __init__(self, state_code="S04", total_constituencies=243, output_file="election_results.csv"):
+    def __init__(self, state_code="S04", total_constituencies=243, output_file="election_results.csv",
+                 max_workers=DEFAULT_WORKERS, requests_per_second=DEFAULT_RPS,
+                 browser_workers=DEFAULT_BROWSERS, base_url=BASE_URL):
         """
         Initialize the ECI scraper
         
@@ -35,177 +245,572 @@ class ECIScraper:
             state_code: State code (S04 for Bihar)
             total_constituencies: Total number of constituencies
             output_file: Output CSV filename
+            max_workers: Number of constituencies fetched concurrently
+            requests_per_second: Request rate limit shared by all fetches
+            browser_workers: Maximum number of Selenium fallback drivers
+            base_url: Results site the constituency pages are fetched from
         """
+        setup_logging()
         self.state_code = state_code
         self.total_constituencies = total_constituencies
         self.output_file = output_file
-        self.base_url = "https://results.eci.gov.in/ResultAcGenNov2025"
-        self.all_data = []
-        
-        # Setup Chrome options for better performance
-        self.chrome_options = webdriver.ChromeOptions()
-        self.chrome_options.add_argument('--headless')  # Run in background
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        self.chrome_options.add_argument('--disable-gpu')
-        # Add user agent to appear more like a real browser
-        self.chrome_options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
+        self.base_url = base_url
+        # Result page URL of every constituency, built once up front
+        self.urls = {
+            n: f"{base_url}/Constituencywise{state_code}{n}.htm"
+            for n in range(1, total_constituencies + 1)
+        }
+        self.records_written = 0
+
+        # Combined CSV, opened for appending for the duration of scrape_all
+        self._master_file = None
+        self._master_writer = None
+
+        # Scraped results waiting for the writer thread, as (number, records)
+        self._results = deque()
+        self._results_ready = threading.Event()
+        self._writer_stop = threading.Event()
+        self._writer_thread = None
+        self._writer_error = None
+
+        # Results table header, read from the first page parsed
+        self._headers = None
+
+        # Constituency numbers already on disk, filled on first resume check
+        self._completed = None
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+
+        # Respectful rate limit across all concurrent fetches
+        self.rate_limiter = TokenBucket(requests_per_second)
+
+        # Selenium is only started if a page can't be read over plain HTTP.
+        # Pool of fallback drivers; each is used by one thread at a time
+        if browser_workers < 1:
+            raise ValueError(f"browser_workers must be at least 1, got {browser_workers}")
+        self.browser_workers = browser_workers
+        self._drivers = []
+        self._drivers_started = 0
+        self._idle_drivers = queue.Queue()
+        self._drivers_lock = threading.Lock()
+
+        # Chrome options for the Selenium fallback
+        self.chrome_options = build_chrome_options()
+
     def create_driver(self):
         """Create and return a Chrome driver instance"""
-        service = Service('/usr/bin/chromedriver')
-        return webdriver.Chrome(service=service, options=self.chrome_options)
+        return new_driver(self.chrome_options, block_resources=True)
+
+    def acquire_driver(self):
+        """Take an idle fallback driver, starting a new one while the pool has room"""
+        try:
+            return self._idle_drivers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._drivers_lock:
+            start_new = self._drivers_started < self.browser_workers
+            if start_new:
+                self._drivers_started += 1
+
+        if not start_new:
+            return self._idle_drivers.get()
+
+        logging.info("Starting Selenium fallback driver")
+        try:
+            driver = self.create_driver()
+        except Exception:
+            with self._drivers_lock:
+                self._drivers_started -= 1
+            raise
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return driver
+
+    def client_session(self):
+        """
+        Create the aiohttp session used for all fetches in a run; result pages
+        are plain HTML tables and share one pool of keep-alive connections
+        """
+        return aiohttp.ClientSession(
+            headers={'User-Agent': USER_AGENT},
+            # Keep idle connections past the default 15s so pauses from the
+            # rate limiter don't cost a fresh TCP/TLS handshake
+            connector=aiohttp.TCPConnector(limit=self.max_workers, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+
+    def quit_drivers(self):
+        """Quit every Selenium fallback driver that was started"""
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers.clear()
+        self._drivers_started = 0
+        self._idle_drivers = queue.Queue()
+
+    @contextmanager
+    def driver_session(self):
+        """
+        Scope for one run: fallback drivers are started on demand inside it,
+        reused for every page, and quit on exit
+        """
+        try:
+            yield
+        finally:
+            self.quit_drivers()
     
     def get_completed_constituencies(self):
         """Check which constituencies have already been scraped"""
+        if self._completed is not None:
+            return self._completed
+
         completed = set()
 
         # Check individual constituency files
         output_dir = "constituency_results"
-        if os.path.exists(output_dir):
-            try:
-                files = os.listdir(output_dir)
-                for filename in files:
-                    if filename.endswith('.csv'):
-                        # Extract constituency number from filename (e.g., "001_Name.csv")
-                        constituency_num = int(filename.split('_')[0])
-                        completed.add(constituency_num)
-                logging.info(f"Found {len(completed)} individual constituency files")
-            except Exception as e:
-                logging.warning(f"Could not read constituency files: {e}")
+        try:
+            # scandir gives names without a stat per entry; a missing directory
+            # just means nothing has been saved yet
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    # Extract constituency number from filename (e.g., "001_Name.csv")
+                    prefix = entry.name.partition('_')[0]
+                    if entry.name.endswith('.csv') and prefix.isdigit():
+                        completed.add(int(prefix))
+            logging.info("Found %s individual constituency files", len(completed))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Without the file list there's no telling which rows are unfinished
+            logging.warning("Could not read constituency files: %s", e)
+            self._completed = completed
+            return completed
 
-        # Also check master CSV file
+        # Those files are written only after their batch was flushed to the
+        # master CSV, so master rows of any other constituency come from a run
+        # stopped mid-batch and may be missing candidates
         if os.path.exists(self.output_file):
             try:
-                df = pd.read_csv(self.output_file)
-                csv_completed = set(df['Constituency_Number'].unique())
-                completed.update(csv_completed)
-                logging.info(f"Found {len(csv_completed)} constituencies in master CSV")
+                self._drop_unfinished_rows(completed)
             except Exception as e:
-                logging.warning(f"Could not read existing CSV: {e}")
+                logging.warning("Could not check existing CSV: %s", e)
 
         if completed:
-            logging.info(f"Total {len(completed)} already completed constituencies")
+            logging.info("Total %s already completed constituencies", len(completed))
 
+        self._completed = completed
         return completed
     
-    def scrape_constituency(self, driver, constituency_num):
+    def _drop_unfinished_rows(self, done):
+        """
+        Remove master CSV rows of constituencies that have no file of their
+        own, so they are scraped again in full instead of skipped
+        """
+        with open(self.output_file, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            col = header.index('Constituency_Number')
+            rows = list(reader)
+        # A short row is a write cut off by an interrupt
+        keep = [
+            row for row in rows
+            if len(row) == len(header) and (not row[col].isdigit() or int(row[col]) in done)
+        ]
+        if len(keep) == len(rows):
+            return
+
+        logging.warning("Dropping %s rows of unfinished constituencies from %s", len(rows) - len(keep), self.output_file)
+        tmp = self.output_file + '.tmp'
+        with open(tmp, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(keep)
+        os.replace(tmp, self.output_file)
+
+    async def scrape_constituency(self, session, constituency_num):
         """
         Scrape data for a single constituency
-        
+
+        The page is fetched over plain HTTP and parsed with lxml. Selenium is
+        only used if the response is an error or yields no candidate rows
+        (e.g. a bot-check page or a table filled in by JavaScript), but not
+        while the server is still throttling. Only pages that yielded records
+        are cached.
+
         Args:
-            driver: Selenium WebDriver instance
+            session: Shared aiohttp ClientSession
             constituency_num: Constituency number
-            
+
         Returns:
             List of dictionaries containing candidate data
         """
         # https://results.eci.gov.in/ResultAcGenNo/v2025/ConstituencywiseS04
-        url = f"{self.base_url}/Constituencywise{self.state_code}{constituency_num}.htm"
-        logging.info(f"Scraping constituency {constituency_num}: {url}")
-        
+        url = self.urls[constituency_num]
+        logging.debug("Scraping constituency %s: %s", constituency_num, url)
+
         try:
-            driver.get(url)
+            # Re-runs parse a recently saved copy instead of hitting the server
+            content = self.read_cached_page(constituency_num)
+            if content is not None:
+                logging.debug("Using cached page for constituency %s", constituency_num)
+                records = self.parse_constituency_html(content, constituency_num)
+                if records:
+                    return records
 
-            # Wait for page to load completely
-            time.sleep(3)  # Initial wait for JavaScript execution
+            status, content = await self.fetch_page(session, url)
 
-            # Set up wait object with longer timeout
-            wait = WebDriverWait(driver, 20)
-            
-            # Extract constituency name - try multiple selectors
-            constituency_name = f"Constituency_{constituency_num}"
-            try:
-                # Try to find the h2 tag with constituency info
-                h2_element = driver.find_element(By.XPATH, "//h2[contains(., 'Assembly Constituency')]")
-                if h2_element and h2_element.text.strip():
-                    # Extract just the constituency name (e.g., "195 - AGIAON")
-                    full_text = h2_element.text.strip()
-                    # Parse "Assembly Constituency 195 - AGIAON (Bihar)"
-                    if ' - ' in full_text:
-                        constituency_name = full_text.split('(')[0].strip().replace('Assembly Constituency', '').strip()
-                    else:
-                        constituency_name = full_text
-                    logging.info(f"Found constituency name: {constituency_name}")
-            except NoSuchElementException:
-                logging.warning(f"Could not find constituency name, using default: {constituency_name}")
-            except Exception as e:
-                logging.warning(f"Error extracting constituency name: {e}")
-            
-            # Find the results table - try multiple approaches
-            try:
-                # First try to find table with specific class
-                table = driver.find_element(By.CSS_SELECTOR, "table.table-striped")
-            except NoSuchElementException:
-                # Fallback to any table
-                table = wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-            
-            # Parse table rows
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            
-            if len(rows) <= 1:
-                logging.warning(f"No data rows found for constituency {constituency_num}")
+            # Still throttled after every retry; browser loads would bypass the
+            # rate limiter and only add to the load, so leave it for a resume
+            if status in THROTTLE_STATUSES:
+                logging.error("Constituency %s still throttled (status %s) after %s retries, skipping it for now",
+                              constituency_num, status, FETCH_RETRIES)
                 return []
-            
-            data = []
-            headers = []
-            
-            # Extract headers
-            header_row = rows[0]
-            header_cells = header_row.find_elements(By.TAG_NAME, "th")
-            if not header_cells:
-                header_cells = header_row.find_elements(By.TAG_NAME, "td")
-            
-            headers = [cell.text.strip() for cell in header_cells]
-            logging.info(f"Found headers: {headers}")
-            
-            # Extract data rows
-            for row in rows[1:]:
-                cols = row.find_elements(By.TAG_NAME, "td")
-                if len(cols) >= 3:  # At least candidate, party, votes
-                    row_data = {
-                        'Constituency_Number': constituency_num,
-                        'Constituency_Name': constituency_name,
-                    }
-                    
-                    # Map columns - adjust based on actual table structure
-                    if len(cols) >= 5:
-                        row_data.update({
-                            'Serial_No': cols[0].text.strip(),
-                            'Candidate': cols[1].text.strip(),
-                            'Party': cols[2].text.strip(),
-                            'EVM_Votes': cols[3].text.strip(),
-                            'Postal_Votes': cols[4].text.strip(),
-                            'Total_Votes': cols[5].text.strip() if len(cols) > 5 else '',
-                            'Percentage': cols[6].text.strip() if len(cols) > 6 else '',
-                        })
-                    else:
-                        # Simpler structure
-                        row_data.update({
-                            'Candidate': cols[0].text.strip(),
-                            'Party': cols[1].text.strip(),
-                            'Votes': cols[2].text.strip(),
-                            'Percentage': cols[3].text.strip() if len(cols) > 3 else '',
-                        })
-                    
-                    data.append(row_data)
-            
-            logging.info(f"Successfully scraped {len(data)} candidates from constituency {constituency_num}")
-            return data
-            
+
+            records = self.parse_constituency_html(content, constituency_num) if status == 200 else []
+
+            if not records:
+                logging.warning("No candidate rows over HTTP (status %s), falling back to Selenium", status)
+                return await asyncio.to_thread(self._scrape_constituency_selenium_pooled, constituency_num, url)
+
+            self.write_cached_page(constituency_num, content)
+            return records
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error("Request failed for constituency %s: %r", constituency_num, e)
+            return []
+        except Exception as e:
+            logging.error("Error scraping constituency %s: %s", constituency_num, e)
+            return []
+
+    async def fetch_page(self, session, url):
+        """
+        GET a result page, retrying connection errors and timeouts with
+        exponential backoff; returns (status, body)
+
+        A 429/503 response pauses the shared rate limiter, so every fetch
+        backs off rather than just this one, and the page is retried
+        """
+        for attempt in range(FETCH_RETRIES + 1):
+            await self.rate_limiter.acquire()
+            try:
+                async with session.get(url) as response:
+                    if response.status not in THROTTLE_STATUSES or attempt == FETCH_RETRIES:
+                        return response.status, await response.read()
+                    delay = self._retry_after(response) or THROTTLE_BACKOFF * 2 ** attempt
+                logging.warning("Server returned %s for %s, pausing requests for %ss", response.status, url, delay)
+                self.rate_limiter.pause(delay)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == FETCH_RETRIES:
+                    raise
+                delay = RETRY_BACKOFF * 2 ** attempt
+                logging.warning("Request for %s failed (%s), retrying in %ss", url, e, delay)
+                await asyncio.sleep(delay)
+
+    def _retry_after(self, response):
+        """Seconds from a Retry-After header given in seconds, capped; None if absent"""
+        value = response.headers.get('Retry-After', '')
+        if value.isdigit():
+            return min(int(value), MAX_THROTTLE_WAIT)
+        return None
+
+    def cache_path(self, constituency_num):
+        """Path of the on-disk copy of a constituency's result page"""
+        return os.path.join(CACHE_DIR, f"{self.state_code}_{constituency_num}.html")
+
+    def read_cached_page(self, constituency_num):
+        """Return the cached page bytes if a fresh copy exists, else None"""
+        path = self.cache_path(constituency_num)
+        try:
+            if time.time() - os.path.getmtime(path) > CACHE_MAX_AGE:
+                return None
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write_cached_page(self, constituency_num, content):
+        """Save a result page that contained a results table"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = self.cache_path(constituency_num)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(content)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            logging.warning("Could not cache page for constituency %s: %s", constituency_num, e)
+
+    def parse_constituency_html(self, html, constituency_num):
+        """
+        Extract candidate records from the HTML of a constituency result page,
+        with no network or browser access
+
+        Args:
+            html: Page source as bytes or str
+            constituency_num: Constituency number
+
+        Returns:
+            List of dictionaries containing candidate data
+        """
+        try:
+            tree = LH.fromstring(html)
+        except etree.ParserError:
+            # Empty body
+            logging.warning("Empty page for constituency %s", constituency_num)
+            return []
+        return self.parse_constituency_page(tree, constituency_num)
+
+    def parse_constituency_page(self, tree, constituency_num):
+        """
+        Extract candidate records from a parsed constituency result page
+
+        Args:
+            tree: lxml document of the result page
+            constituency_num: Constituency number
+
+        Returns:
+            List of dictionaries containing candidate data
+        """
+        # Extract constituency name
+        constituency_name = f"Constituency_{constituency_num}"
+        h2_texts = HEADING_XPATH(tree)
+        if h2_texts:
+            constituency_name = self._parse_constituency_name(h2_texts[0].text_content())
+            logging.debug("Found constituency name: %s", constituency_name)
+        else:
+            logging.warning("Could not find constituency name, using default: %s", constituency_name)
+
+        # Find the results table - prefer the striped results table, fall back to any table
+        tables = RESULTS_TABLE_XPATH(tree) or ANY_TABLE_XPATH(tree)
+        if not tables:
+            logging.warning("No results table found for constituency %s", constituency_num)
+            return []
+        table_rows = TABLE_ROWS_XPATH(tables[0])
+        if table_rows and self._headers is None:
+            # Every constituency uses the same table layout, so the header
+            # row (which may use th) is only read from the first page
+            header = table_rows[0]
+            self._headers = [cell.text_content().strip() for cell in header.findall("th") or header.findall("td")]
+            logging.debug("Found headers: %s", self._headers)
+
+        rows = [self._headers]
+        for row in table_rows[1:]:
+            rows.append([cell.text_content().strip() for cell in row.findall("td")])
+
+        return self._rows_to_records(rows, constituency_num, constituency_name)
+
+    def _parse_constituency_name(self, full_text):
+        """Turn "Assembly Constituency 195 - AGIAON (Bihar)" into "195 - AGIAON" """
+        full_text = " ".join(full_text.split())
+        if ' - ' in full_text:
+            return full_text.split('(')[0].strip().replace('Assembly Constituency', '').strip()
+        return full_text
+
+    def _rows_to_records(self, rows, constituency_num, constituency_name):
+        """
+        Convert table rows (lists of cell texts, header row first) into candidate records
+        """
+        if len(rows) <= 1:
+            logging.warning("No data rows found for constituency %s", constituency_num)
+            return []
+
+        data = []
+        for cols in rows[1:]:
+            if len(cols) >= 3:  # At least candidate, party, votes
+                row_data = {
+                    'Constituency_Number': constituency_num,
+                    'Constituency_Name': constituency_name,
+                }
+
+                # Map columns - adjust based on actual table structure
+                if len(cols) >= 5:
+                    row_data.update({
+                        'Serial_No': cols[0],
+                        'Candidate': cols[1],
+                        'Party': cols[2],
+                        'EVM_Votes': cols[3],
+                        'Postal_Votes': cols[4],
+                        'Total_Votes': cols[5] if len(cols) > 5 else '',
+                        'Percentage': cols[6] if len(cols) > 6 else '',
+                    })
+                else:
+                    # Simpler structure
+                    row_data.update({
+                        'Candidate': cols[0],
+                        'Party': cols[1],
+                        'Total_Votes': cols[2],
+                        'Percentage': cols[3] if len(cols) > 3 else '',
+                    })
+
+                data.append(row_data)
+
+        logging.debug("Successfully scraped %s candidates from constituency %s", len(data), constituency_num)
+        return data
+
+    def _scrape_constituency_selenium_pooled(self, constituency_num, url):
+        """Run the Selenium fallback on a pooled driver"""
+        driver = self.acquire_driver()
+        try:
+            return self._scrape_constituency_selenium(driver, constituency_num, url)
+        finally:
+            self._idle_drivers.put(driver)
+
+    def _scrape_constituency_selenium(self, driver, constituency_num, url):
+        """Selenium fallback for scrape_constituency"""
+        try:
+            driver.get(url)
+
+            # Single explicit gate: returns as soon as a table has data rows
+            WebDriverWait(driver, PAGE_WAIT_TIMEOUT).until(TABLE_ROWS_PRESENT)
+
+            # One round-trip for the whole page, then parse locally
+            html = driver.execute_script(PAGE_HTML_JS).encode('utf-8')
+            records = self.parse_constituency_html(html, constituency_num)
+            if records:
+                self.write_cached_page(constituency_num, html)
+            return records
+
         except TimeoutException:
-            logging.error(f"Timeout loading constituency {constituency_num}")
+            logging.error("Timeout loading constituency %s", constituency_num)
             return []
         except Exception as e:
-            logging.error(f"Error scraping constituency {constituency_num}: {str(e)}")
+            logging.error("Error scraping constituency %s: %s", constituency_num, e)
             return []
-    
+
+    def open_master_csv(self):
+        """Open the combined CSV for appending, writing the header if it is new"""
+        if os.path.exists(self.output_file):
+            self._drop_partial_line()
+        is_new = not os.path.exists(self.output_file) or os.path.getsize(self.output_file) == 0
+
+        # New rows follow the existing header's column order, so appending to
+        # a file written with a different layout doesn't shift columns
+        fieldnames = MASTER_FIELDS
+        if not is_new:
+            with open(self.output_file, newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), [])
+            if set(MASTER_FIELDS) <= set(header):
+                fieldnames = header
+            else:
+                logging.warning("%s has unexpected columns %s; appending as %s", self.output_file, header, MASTER_FIELDS)
+
+        self._master_file = open(self.output_file, 'a', newline='', encoding='utf-8')
+        self._master_writer = csv.DictWriter(self._master_file, fieldnames=fieldnames, restval='')
+        if is_new:
+            self._master_writer.writeheader()
+            self._master_file.flush()
+
+    def _drop_partial_line(self):
+        """
+        Cut off a trailing row left incomplete by an interrupted run, so new
+        rows aren't appended onto the end of it
+        """
+        with open(self.output_file, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(max(0, size - 64 * 1024))
+            tail = f.read()
+            if tail.endswith(b'\n'):
+                return
+            last_newline = tail.rfind(b'\n')
+            if last_newline == -1:
+                # Not a row cut short by this scraper; leave the file alone
+                logging.error("%s does not end in a complete row and no row boundary was found "
+                              "near the end; not truncating it", self.output_file)
+                return
+            logging.warning("Dropping incomplete last row of %s", self.output_file)
+            f.truncate(size - len(tail) + last_newline + 1)
+
+    def append_data(self, constituency_data):
+        """Append one constituency's records to the combined CSV (flushed per batch)"""
+        self._master_writer.writerows(constituency_data)
+        self.records_written += len(constituency_data)
+
+    def queue_result(self, constituency_num, constituency_data):
+        """Hand a scraped constituency to the writer thread"""
+        # Stop feeding a writer that has died; nothing queued would be saved
+        if self._writer_error is not None:
+            raise self._writer_error
+        self._results.append((constituency_num, constituency_data))
+        self._results_ready.set()
+
+    def start_writer(self):
+        """Start the background thread that saves queued results"""
+        self._writer_stop.clear()
+        self._writer_error = None
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="csv-writer", daemon=True)
+        self._writer_thread.start()
+
+    def stop_writer(self):
+        """
+        Let the writer thread drain the queue, then wait for it to exit;
+        re-raises the error that stopped it, if any
+        """
+        if self._writer_thread is not None:
+            self._writer_stop.set()
+            self._results_ready.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+        if self._writer_error is not None:
+            raise self._writer_error
+
+    def _writer_loop(self):
+        """Run the writer, recording any error for stop_writer and queue_result"""
+        try:
+            self._write_results()
+        except Exception as e:
+            logging.error("Writer thread stopped, results are no longer being saved: %s", e)
+            self._writer_error = e
+
+    def _write_results(self):
+        """Save queued results every WRITE_BATCH_SIZE constituencies until stopped and drained"""
+        batch = []
+        while True:
+            self._results_ready.wait()
+            self._results_ready.clear()
+            # Once stop is set no more results arrive, so this drain is the last
+            stopping = self._writer_stop.is_set()
+            while self._results:
+                batch.append(self._results.popleft())
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    self._write_batch(batch)
+                    batch = []
+            if stopping:
+                if batch:
+                    self._write_batch(batch)
+                return
+
+    def _write_batch(self, batch):
+        """
+        Append a batch to the combined CSV with one flush, then write each
+        constituency's own file
+        """
+        for constituency_num, constituency_data in batch:
+            try:
+                self.append_data(constituency_data)
+            except Exception as e:
+                logging.error("Failed to append constituency %s: %s", constituency_num, e)
+        self._master_file.flush()
+
+        for constituency_num, constituency_data in batch:
+            try:
+                constituency_name = constituency_data[0]['Constituency_Name']
+                self.save_constituency_data(constituency_data, constituency_num, constituency_name)
+                if self._completed is not None:
+                    self._completed.add(constituency_num)
+            except Exception as e:
+                logging.error("Failed to process constituency %s: %s", constituency_num, e)
+
     def save_data(self):
-        """Save collected data to CSV"""
-        if self.all_data:
-            df = pd.DataFrame(self.all_data)
-            df.to_csv(self.output_file, index=False)
-            logging.info(f"Saved {len(self.all_data)} records to {self.output_file}")
+        """Flush and close the combined CSV; rows are already on disk as they are appended"""
+        if self._master_file is not None:
+            self._master_file.close()
+            self._master_file = None
+            self._master_writer = None
+            logging.info("Wrote %s new records to %s", self.records_written, self.output_file)
 
     def save_constituency_data(self, constituency_data, constituency_num, constituency_name):
         """Save individual constituency data to its own CSV file"""
@@ -218,70 +823,71 @@ class ECIScraper:
             safe_name = constituency_name.replace(" ", "_").replace("/", "-").replace("\\", "-")
             filename = f"{output_dir}/{constituency_num:03d}_{safe_name}.csv"
 
-            df = pd.DataFrame(constituency_data)
-            df.to_csv(filename, index=False)
-            logging.info(f"Saved {len(constituency_data)} records to {filename}")
+            # Rows of a short table may lack some columns; take the union in order
+            fieldnames = list(dict.fromkeys(key for record in constituency_data for key in record))
+            # Written under a temporary name so an interrupted write never
+            # leaves a partial file that would count as completed on resume
+            with open(filename + '.tmp', 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+                writer.writeheader()
+                writer.writerows(constituency_data)
+            os.replace(filename + '.tmp', filename)
+            logging.debug("Saved %s records to %s", len(constituency_data), filename)
             return filename
         return None
 
-    def scrape_all(self, start_from=1):
+    async def scrape_all(self, start_from=1):
         """
         Scrape all constituencies
         
         Args:
             start_from: Constituency number to start from (for resuming)
         """
+        # Only numbers 1..total have a URL
+        if not 1 <= start_from <= self.total_constituencies:
+            raise ValueError(f"start_from must be between 1 and {self.total_constituencies}, got {start_from}")
+
         # Check for already completed constituencies
         completed = self.get_completed_constituencies()
         
-        # Load existing data if resuming
-        if os.path.exists(self.output_file):
-            try:
-                df = pd.read_csv(self.output_file)
-                self.all_data = df.to_dict('records')
-                logging.info(f"Loaded {len(self.all_data)} existing records")
-            except Exception as e:
-                logging.warning(f"Could not load existing data: {e}")
-        
-        driver = self.create_driver()
-        
+        numbers = range(start_from, self.total_constituencies + 1)
+        pending = [n for n in numbers if n not in completed]
+        skipped = len(numbers) - len(pending)
+        logging.info("%s constituencies to scrape, skipping %s already completed", len(pending), skipped)
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+        finished = 0
+
+        async def worker(session, constituency_num):
+            nonlocal finished
+            async with semaphore:
+                constituency_data = await self.scrape_constituency(session, constituency_num)
+
+            # Disk writes happen on the writer thread, off the event loop
+            if constituency_data:
+                self.queue_result(constituency_num, constituency_data)
+
+            finished += 1
+            logging.info("Progress: %s/%s constituencies completed", finished, len(pending))
+
+        self.open_master_csv()
+        self.start_writer()
+
         try:
-            for constituency_num in range(start_from, self.total_constituencies + 1):
-                # Skip if already completed
-                if constituency_num in completed:
-                    logging.info(f"Skipping constituency {constituency_num} (already completed)")
-                    continue
-                
-                try:
-                    # Scrape constituency
-                    constituency_data = self.scrape_constituency(driver, constituency_num)
-
-                    if constituency_data:
-                        # Save individual constituency file
-                        constituency_name = constituency_data[0]['Constituency_Name']
-                        self.save_constituency_data(constituency_data, constituency_num, constituency_name)
-
-                        # Add to master data and save combined file
-                        self.all_data.extend(constituency_data)
-                        self.save_data()
-
-                        logging.info(f"Progress: {constituency_num}/{self.total_constituencies} constituencies completed")
-
-                    # Respectful delay to avoid overloading the server
-                    time.sleep(3)
-                    
-                except Exception as e:
-                    logging.error(f"Failed to process constituency {constituency_num}: {e}")
-                    # Continue with next constituency
-                    continue
-            
-            logging.info("Scraping completed!")
-            logging.info(f"Total records collected: {len(self.all_data)}")
+            with self.driver_session():
+                async with self.client_session() as session:
+                    await asyncio.gather(*(worker(session, n) for n in pending))
 
         finally:
-            driver.quit()
+            try:
+                self.stop_writer()
+            finally:
+                self.save_data()
+
+        logging.info("Scraping completed!")
+        logging.info("Total records collected: %s", self.records_written)
 
-    def scrape_single(self, constituency_num):
+    async def scrape_single(self, constituency_num):
         """
         Scrape data for a single constituency
 
@@ -289,44 +895,70 @@ class ECIScraper:
             constituency_num: Constituency number to scrape
         """
         if constituency_num < 1 or constituency_num > self.total_constituencies:
-            logging.error(f"Invalid constituency number: {constituency_num}. Must be between 1 and {self.total_constituencies}")
+            logging.error("Invalid constituency number: %s. Must be between 1 and %s", constituency_num, self.total_constituencies)
             return False
 
-        logging.info(f"Starting to scrape single constituency: {constituency_num}")
-
-        driver = self.create_driver()
+        logging.info("Starting to scrape single constituency: %s", constituency_num)
 
         try:
             # Scrape the constituency
-            constituency_data = self.scrape_constituency(driver, constituency_num)
+            with self.driver_session():
+                async with self.client_session() as session:
+                    constituency_data = await self.scrape_constituency(session, constituency_num)
 
-            if constituency_data:
-                # Save individual constituency file
-                constituency_name = constituency_data[0]['Constituency_Name']
-                filename = self.save_constituency_data(constituency_data, constituency_num, constituency_name)
+            return self._save_single(constituency_data, constituency_num)
 
-                logging.info(f"Successfully scraped constituency {constituency_num}")
-                print(f"\nData saved to: {filename}")
-                print(f"Total candidates: {len(constituency_data)}")
-                return True
-            else:
-                logging.warning(f"No data retrieved for constituency {constituency_num}")
-                return False
+        except Exception as e:
+            logging.error("Failed to scrape constituency %s: %s", constituency_num, e)
+            return False
+
+    def scrape_html_file(self, path, constituency_num):
+        """
+        Parse a saved result page instead of fetching it
+
+        Args:
+            path: HTML file of the constituency result page
+            constituency_num: Constituency number the page belongs to
+        """
+        logging.info("Parsing constituency %s from %s", constituency_num, path)
+
+        try:
+            with open(path, 'rb') as f:
+                constituency_data = self.parse_constituency_html(f.read(), constituency_num)
+
+            return self._save_single(constituency_data, constituency_num)
 
         except Exception as e:
-            logging.error(f"Failed to scrape constituency {constituency_num}: {e}")
+            logging.error("Failed to parse %s: %s", path, e)
             return False
 
-        finally:
-            driver.quit()
+    def _save_single(self, constituency_data, constituency_num):
+        """Save and report the result of scrape_single / scrape_html_file"""
+        if constituency_data:
+            # Save individual constituency file
+            constituency_name = constituency_data[0]['Constituency_Name']
+            filename = self.save_constituency_data(constituency_data, constituency_num, constituency_name)
+
+            logging.info("Successfully scraped constituency %s", constituency_num)
+            print(f"\nData saved to: {filename}")
+            print(f"Total candidates: {len(constituency_data)}")
+            return True
+        else:
+            logging.warning("No data retrieved for constituency %s", constituency_num)
+            return False
 
     def generate_summary(self):
         """Generate a summary report of the scraped data"""
-        if not self.all_data:
+        if not os.path.exists(self.output_file):
+            logging.warning("No data to summarize")
+            return
+
+        # Read the combined file back once, now that all rows are on disk;
+        # the summary only needs these two columns
+        df = pd.read_csv(self.output_file, usecols=lambda c: c in ('Constituency_Number', 'Party'))
+        if df.empty:
             logging.warning("No data to summarize")
             return
-        
-        df = pd.DataFrame(self.all_data)
         
         summary = f"""
         ============================================
@@ -344,6 +976,46 @@ class ECIScraper:
         print(summary)
         logging.info(summary)
 
+    def export_parquet(self):
+        """
+        Write the combined results next to the CSV as a typed, compressed
+        Parquet file; the CSV stays the working file because it can be
+        appended to and resumed from
+        """
+        if not os.path.exists(self.output_file):
+            logging.warning("No data to export")
+            return None
+
+        parquet_file = os.path.splitext(self.output_file)[0] + '.parquet'
+        try:
+            # Read every column as text so a stray row can't break parsing, then
+            # type the key; rows without a valid whole number keep a null key
+            df = pd.read_csv(self.output_file, dtype=str, keep_default_na=False, on_bad_lines='warn')
+            if 'Constituency_Number' in df.columns:
+                num = pd.to_numeric(df['Constituency_Number'], errors='coerce')
+                num = num.where((num % 1 == 0) & num.abs().lt(2 ** 31))
+                df['Constituency_Number'] = num.astype('Int32')
+            df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+        except ImportError:
+            logging.error("Parquet export needs pyarrow: pip install pyarrow")
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logging.error("Could not export %s to Parquet: %s", self.output_file, e)
+            return None
+
+        logging.info("Wrote %s records to %s", len(df), parquet_file)
+        return parquet_file
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop if it is installed"""
+    if uvloop is not None:
+        # uvloop.run() only exists from uvloop 0.18
+        if hasattr(uvloop, 'run'):
+            return uvloop.run(coro)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
 
 def main():
     """Main execution function"""
@@ -359,11 +1031,20 @@ Examples:
   # Scrape a single constituency
   python scraper.py --constituency 42
 
+  # Parse a saved copy of constituency 42's result page
+  python scraper.py --constituency 42 --html-file cache/S04_42.html
+
   # Scrape all starting from a specific constituency
   python scraper.py --all --start-from 50
 
   # Use custom state code and total constituencies
   python scraper.py --all --state S05 --total 200
+
+  # Also save the results as Parquet
+  python scraper.py --all --parquet
+
+  # Slow down for a server that is rate limiting
+  python scraper.py --all --workers 2 --rps 1
         """
     )
 
@@ -379,16 +1060,41 @@ Examples:
                         help='Total number of constituencies (default: 243)')
     parser.add_argument('--output', default="bihar_election_results.csv",
                         help='Output CSV filename for combined results (default: bihar_election_results.csv)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help='Number of pages fetched concurrently (default: %(default)s)')
+    parser.add_argument('--rps', type=float, default=DEFAULT_RPS,
+                        help='Maximum requests per second across all workers (default: %(default)s)')
+    parser.add_argument('--browsers', type=int, default=DEFAULT_BROWSERS,
+                        help='Maximum Chrome instances for pages that need the Selenium fallback (default: %(default)s)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also write the combined results as a zstd-compressed Parquet file (needs pyarrow)')
+    parser.add_argument('--html-file',
+                        help='Parse a saved result page instead of fetching it (use with --constituency)')
 
     args = parser.parse_args()
 
     # Validate arguments
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.rps <= 0:
+        parser.error("--rps must be greater than 0")
+
+    if args.browsers < 1:
+        parser.error("--browsers must be at least 1")
+
     if not args.all and not args.constituency:
         parser.error("Please specify either --all or --constituency")
 
     if args.all and args.constituency:
         parser.error("Cannot use --all and --constituency together. Choose one.")
 
+    if args.all and not 1 <= args.start_from <= args.total:
+        parser.error(f"--start-from must be between 1 and --total ({args.total})")
+
+    if args.html_file and not args.constituency:
+        parser.error("--html-file needs --constituency to number the records")
+
     print("=" * 60)
     print("ECI Election Results Scraper")
     print("=" * 60)
@@ -397,7 +1103,10 @@ Examples:
     scraper = ECIScraper(
         state_code=args.state,
         total_constituencies=args.total,
-        output_file=args.output
+        output_file=args.output,
+        max_workers=args.workers,
+        requests_per_second=args.rps,
+        browser_workers=args.browsers
     )
 
     start_time = datetime.now()
@@ -409,7 +1118,10 @@ Examples:
             print(f"State code: {args.state}")
             print(f"Log file: eci_scraper.log\n")
 
-            success = scraper.scrape_single(args.constituency)
+            if args.html_file:
+                success = scraper.scrape_html_file(args.html_file, args.constituency)
+            else:
+                success = run_async(scraper.scrape_single(args.constituency))
 
             if success:
                 print("\n" + "=" * 60)
@@ -427,8 +1139,10 @@ Examples:
             print(f"Output file: {args.output}")
             print(f"Log file: eci_scraper.log\n")
 
-            scraper.scrape_all(start_from=args.start_from)
+            run_async(scraper.scrape_all(start_from=args.start_from))
             scraper.generate_summary()
+            if args.parquet:
+                scraper.export_parquet()
 
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user!")
@@ -438,7 +1152,7 @@ Examples:
             print(f"Progress saved to {args.output}")
 
     except Exception as e:
-        logging.error(f"Fatal error: {e}")
+        logging.error("Fatal error: %s", e)
         if args.all:
             scraper.save_data()
             print(f"Error occurred. Progress saved to {args.output}")
@@ -1,27 +1,36 @@
 """
 Test script to debug page loading issues
+
+Uses scraper.get_driver(), so when this is imported into an interactive
+session (`from test_page_load import check_page`), repeated checks reuse one
+Chrome instead of starting a new one each time. The driver is started with
+plain options rather than the scraper's fallback setup, so pages load with
+their images, stylesheets and fonts as a browser would normally show them.
 """
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 import time
 
-# Setup Chrome options
-chrome_options = webdriver.ChromeOptions()
-chrome_options.add_argument('--headless')
-chrome_options.add_argument('--no-sandbox')
-chrome_options.add_argument('--disable-dev-shm-usage')
-chrome_options.add_argument('--disable-gpu')
+from scraper import USER_AGENT, get_driver, quit_driver
+
+DEFAULT_URL = "https://results.eci.gov.in/ResultAcGenNov2025/ConstituencywiseS04195.htm"
+
 
-# Add user agent to look more like a real browser
-chrome_options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+def plain_chrome_options():
+    """Headless Chrome with the scraper's user agent and nothing blocked"""
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument(f'--user-agent={USER_AGENT}')
+    return options
 
-# Create driver
-service = Service('/usr/bin/chromedriver')
-driver = webdriver.Chrome(service=service, options=chrome_options)
 
-try:
-    url = "https://results.eci.gov.in/ResultAcGenNov2025/ConstituencywiseS04195.htm"
+def check_page(url=DEFAULT_URL):
+    """Load a page, save its source and report what was found"""
+    driver = get_driver(plain_chrome_options(), block_resources=False)
+
     print(f"Loading: {url}")
 
     driver.get(url)
@@ -60,5 +69,9 @@ try:
 
     print(f"\nFull page source saved to: /tmp/page_source.html")
 
-finally:
-    driver.quit()
+
+if __name__ == "__main__":
+    try:
+        check_page()
+    finally:
+        quit_driver()